@@ -10,12 +10,26 @@ import { useState } from "react";
 import { toast } from "sonner";
 import { Link } from "wouter";
 
+// Formatters are costly to construct; build them once instead of per chart card.
+const createdAtFormat = new Intl.DateTimeFormat();
+const gregorianDateFormat = new Intl.DateTimeFormat('es-ES', {
+  year: 'numeric',
+  month: 'long',
+  day: 'numeric',
+});
+
 export default function Dashboard() {
   const { user, loading: authLoading } = useAuth();
   const [showForm, setShowForm] = useState(false);
   
-  const { data: charts, isLoading: chartsLoading, refetch } = trpc.birthChart.list.useQuery();
-  const createChart = trpc.birthChart.create.useMutation();
+  const utils = trpc.useUtils();
+  const { data: charts, isLoading: chartsLoading } = trpc.birthChart.list.useQuery();
+  const createChart = trpc.birthChart.create.useMutation({
+    onSuccess: ({ chart }) => {
+      // La mutación ya devuelve la carta creada; no hace falta volver a pedir la lista
+      utils.birthChart.list.setData(undefined, (prev) => (prev ? [chart, ...prev] : [chart]));
+    },
+  });
 
   const [formData, setFormData] = useState({
     personName: "",
@@ -61,7 +75,6 @@ export default function Dashboard() {
         country: "",
         timezone: "America/Mexico_City",
       });
-      refetch();
     } catch (error) {
       toast.error("Error al crear carta natal");
       console.error(error);
@@ -236,18 +249,14 @@ export default function Dashboard() {
                             <Star className="w-6 h-6 text-primary" />
                           </div>
                           <div className="text-xs text-muted-foreground">
-                            {new Date(chart.createdAt).toLocaleDateString()}
+                            {createdAtFormat.format(new Date(chart.createdAt))}
                           </div>
                         </div>
                         <CardTitle className="text-lg">
                           {chart.personName || "Carta Natal"}
                         </CardTitle>
                         <CardDescription>
-                          {new Date(chart.gregorianDate).toLocaleDateString('es-ES', {
-                            year: 'numeric',
-                            month: 'long',
-                            day: 'numeric',
-                          })}
+                          {gregorianDateFormat.format(new Date(chart.gregorianDate))}
                         </CardDescription>
                       </CardHeader>
                       <CardContent>
@@ -0,0 +1 @@
+CREATE INDEX `mazalAnalyses_birthChartId_idx` ON `mazalAnalyses` (`birthChartId`);
\ No newline at end of file
@@ -0,0 +1 @@
+CREATE INDEX `birthCharts_userId_idx` ON `birthCharts` (`userId`);
\ No newline at end of file
@@ -0,0 +1,3 @@
+CREATE INDEX `compatibilityAnalyses_userId_idx` ON `compatibilityAnalyses` (`userId`);
+--> statement-breakpoint
+CREATE INDEX `reports_userId_idx` ON `reports` (`userId`);
\ No newline at end of file
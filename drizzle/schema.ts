@@ -1,4 +1,4 @@
-import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, float, boolean } from "drizzle-orm/mysql-core";
+import { int, mysqlEnum, mysqlTable, text, timestamp, varchar, float, boolean, index } from "drizzle-orm/mysql-core";
 
 /**
  * Core user table backing auth flow.
@@ -85,7 +85,10 @@ export const birthCharts = mysqlTable("birthCharts", {
   // Metadata
   createdAt: timestamp("createdAt").defaultNow().notNull(),
   updatedAt: timestamp("updatedAt").defaultNow().onUpdateNow().notNull(),
-});
+}, (table) => [
+  // Listado por usuario; InnoDB incluye el id en el índice, así que también cubre ORDER BY id
+  index("birthCharts_userId_idx").on(table.userId),
+]);
 
 export type BirthChart = typeof birthCharts.$inferSelect;
 export type InsertBirthChart = typeof birthCharts.$inferInsert;
@@ -114,7 +117,10 @@ export const mazalAnalyses = mysqlTable("mazalAnalyses", {
   // Metadata
   createdAt: timestamp("createdAt").defaultNow().notNull(),
   updatedAt: timestamp("updatedAt").defaultNow().onUpdateNow().notNull(),
-});
+}, (table) => [
+  // getMazalAnalysisByChartId filtra por birthChartId
+  index("mazalAnalyses_birthChartId_idx").on(table.birthChartId),
+]);
 
 export type MazalAnalysis = typeof mazalAnalyses.$inferSelect;
 export type InsertMazalAnalysis = typeof mazalAnalyses.$inferInsert;
@@ -140,7 +146,9 @@ export const reports = mysqlTable("reports", {
   // Metadata
   generatedAt: timestamp("generatedAt").defaultNow().notNull(),
   downloadCount: int("downloadCount").default(0).notNull(),
-});
+}, (table) => [
+  index("reports_userId_idx").on(table.userId),
+]);
 
 export type Report = typeof reports.$inferSelect;
 export type InsertReport = typeof reports.$inferInsert;
@@ -164,7 +172,9 @@ export const compatibilityAnalyses = mysqlTable("compatibilityAnalyses", {
   
   // Metadata
   createdAt: timestamp("createdAt").defaultNow().notNull(),
-});
+}, (table) => [
+  index("compatibilityAnalyses_userId_idx").on(table.userId),
+]);
 
 export type CompatibilityAnalysis = typeof compatibilityAnalyses.$inferSelect;
 export type InsertCompatibilityAnalysis = typeof compatibilityAnalyses.$inferInsert;
@@ -13,6 +13,11 @@ export async function createContext(
 ): Promise<TrpcContext> {
   let user: User | null = null;
 
+  // Anonymous requests carry no cookies; skip the session verification path.
+  if (!opts.req.headers.cookie) {
+    return { req: opts.req, res: opts.res, user };
+  }
+
   try {
     user = await sdk.authenticateRequest(opts.req);
   } catch (error) {
@@ -1,7 +1,14 @@
+// mysql2 treats connectionLimit 0 as unbounded; only accept positive integers.
+function parsePoolSize(value: string | undefined): number {
+  const size = Number(value ?? "10");
+  return Number.isInteger(size) && size > 0 ? size : 10;
+}
+
 export const ENV = {
   appId: process.env.VITE_APP_ID ?? "",
   cookieSecret: process.env.JWT_SECRET ?? "",
   databaseUrl: process.env.DATABASE_URL ?? "",
+  databasePoolSize: parsePoolSize(process.env.DATABASE_POOL_SIZE),
   oAuthServerUrl: process.env.OAUTH_SERVER_URL ?? "",
   ownerOpenId: process.env.OWNER_OPEN_ID ?? "",
   isProduction: process.env.NODE_ENV === "production",
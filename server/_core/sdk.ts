@@ -7,6 +7,7 @@ import { SignJWT, jwtVerify } from "jose";
 import type { User } from "../../drizzle/schema";
 import * as db from "../db";
 import { ENV } from "./env";
+import { UserCache } from "./userCache";
 import type {
   ExchangeTokenRequest,
   ExchangeTokenResponse,
@@ -27,6 +28,30 @@ export type SessionPayload = {
 const EXCHANGE_TOKEN_PATH = `/webdev.v1.WebDevAuthPublicService/ExchangeToken`;
 const GET_USER_INFO_PATH = `/webdev.v1.WebDevAuthPublicService/GetUserInfo`;
 const GET_USER_INFO_WITH_JWT_PATH = `/webdev.v1.WebDevAuthPublicService/GetUserInfoWithJwt`;
+// lastSignedIn only needs minute-level precision; skip the write on most requests.
+const LAST_SIGNED_IN_WRITE_INTERVAL_MS = 60_000;
+// Session lookups hit the users table on every request; keep resolved users briefly.
+const USER_CACHE_TTL_MS = 60_000;
+const USER_CACHE_MAX_ENTRIES = 10_000;
+
+// Anonymous and expired sessions warn on every request; emit at most one line per interval.
+const AUTH_WARN_INTERVAL_MS = 5_000;
+let lastAuthWarnAt = -Infinity;
+let suppressedAuthWarnings = 0;
+
+function warnAuth(message: string, ...details: unknown[]) {
+  const now = performance.now();
+  if (now - lastAuthWarnAt < AUTH_WARN_INTERVAL_MS) {
+    suppressedAuthWarnings++;
+    return;
+  }
+  if (suppressedAuthWarnings > 0) {
+    details.push(`(${suppressedAuthWarnings} similar warnings suppressed)`);
+  }
+  lastAuthWarnAt = now;
+  suppressedAuthWarnings = 0;
+  console.warn(`[Auth] ${message}`, ...details);
+}
 
 class OAuthService {
   constructor(private client: ReturnType<typeof axios.create>) {
@@ -85,21 +110,29 @@ const createOAuthHttpClient = (): AxiosInstance =>
 class SDKServer {
   private readonly client: AxiosInstance;
   private readonly oauthService: OAuthService;
+  private readonly userCache = new UserCache(USER_CACHE_TTL_MS, USER_CACHE_MAX_ENTRIES);
+  private sessionSecret: Uint8Array | null = null;
 
   constructor(client: AxiosInstance = createOAuthHttpClient()) {
     this.client = client;
     this.oauthService = new OAuthService(this.client);
   }
 
+  // Drop a cached user whose row was just rewritten (e.g. on OAuth login).
+  invalidateCachedUser(openId: string) {
+    this.userCache.delete(openId);
+  }
+
   private deriveLoginMethod(
     platforms: unknown,
     fallback: string | null | undefined
   ): string | null {
     if (fallback && fallback.length > 0) return fallback;
     if (!Array.isArray(platforms) || platforms.length === 0) return null;
-    const set = new Set<string>(
-      platforms.filter((p): p is string => typeof p === "string")
-    );
+    const set = new Set<string>();
+    for (const p of platforms) {
+      if (typeof p === "string") set.add(p);
+    }
     if (set.has("REGISTERED_PLATFORM_EMAIL")) return "email";
     if (set.has("REGISTERED_PLATFORM_GOOGLE")) return "google";
     if (set.has("REGISTERED_PLATFORM_APPLE")) return "apple";
@@ -109,7 +142,7 @@ class SDKServer {
     )
       return "microsoft";
     if (set.has("REGISTERED_PLATFORM_GITHUB")) return "github";
-    const first = Array.from(set)[0];
+    const first = set.values().next().value;
     return first ? first.toLowerCase() : null;
   }
 
@@ -155,8 +188,11 @@ class SDKServer {
   }
 
   private getSessionSecret() {
-    const secret = ENV.cookieSecret;
-    return new TextEncoder().encode(secret);
+    // ENV is read once at startup, so the encoded key never changes.
+    if (!this.sessionSecret) {
+      this.sessionSecret = new TextEncoder().encode(ENV.cookieSecret);
+    }
+    return this.sessionSecret;
   }
 
   /**
@@ -201,7 +237,7 @@ class SDKServer {
     cookieValue: string | undefined | null
   ): Promise<{ openId: string; appId: string; name: string } | null> {
     if (!cookieValue) {
-      console.warn("[Auth] Missing session cookie");
+      warnAuth("Missing session cookie");
       return null;
     }
 
@@ -217,7 +253,7 @@ class SDKServer {
         !isNonEmptyString(appId) ||
         !isNonEmptyString(name)
       ) {
-        console.warn("[Auth] Session payload missing required fields");
+        warnAuth("Session payload missing required fields");
         return null;
       }
 
@@ -227,7 +263,7 @@ class SDKServer {
         name,
       };
     } catch (error) {
-      console.warn("[Auth] Session verification failed", String(error));
+      warnAuth("Session verification failed", String(error));
       return null;
     }
   }
@@ -268,7 +304,11 @@ class SDKServer {
 
     const sessionUserId = session.openId;
     const signedInAt = new Date();
-    let user = await db.getUserByOpenId(sessionUserId);
+    let user = this.userCache.get(sessionUserId);
+    if (!user) {
+      user = await db.getUserByOpenId(sessionUserId);
+      if (user) this.userCache.set(user);
+    }
 
     // If user not in DB, sync from OAuth server automatically
     if (!user) {
@@ -282,6 +322,7 @@ class SDKServer {
           lastSignedIn: signedInAt,
         });
         user = await db.getUserByOpenId(userInfo.openId);
+        if (user) this.userCache.set(user);
       } catch (error) {
         console.error("[Auth] Failed to sync user from OAuth:", error);
         throw ForbiddenError("Failed to sync user info");
@@ -292,10 +333,20 @@ class SDKServer {
       throw ForbiddenError("User not found");
     }
 
-    await db.upsertUser({
-      openId: user.openId,
-      lastSignedIn: signedInAt,
-    });
+    if (
+      signedInAt.getTime() - user.lastSignedIn.getTime() >=
+      LAST_SIGNED_IN_WRITE_INTERVAL_MS
+    ) {
+      // Fire-and-forget: the request does not depend on this write.
+      db.upsertUser({
+        openId: user.openId,
+        lastSignedIn: signedInAt,
+      }).catch(error => {
+        console.error("[Auth] Failed to update lastSignedIn:", error);
+      });
+      user = { ...user, lastSignedIn: signedInAt };
+      this.userCache.update(user);
+    }
 
     return user;
   }
@@ -0,0 +1,55 @@
+import type { User } from "../../drizzle/schema";
+
+// expiresAt is on the monotonic performance.now() clock, not wall time.
+type CachedUser = { user: User; expiresAt: number };
+
+// Bounded LRU of users resolved from the database. The TTL is measured from the
+// database read: hits and in-place updates never extend an entry's lifetime.
+export class UserCache {
+  private readonly entries = new Map<string, CachedUser>();
+
+  constructor(
+    private readonly ttlMs: number,
+    private readonly maxEntries: number
+  ) {}
+
+  get size() {
+    return this.entries.size;
+  }
+
+  get(openId: string): User | undefined {
+    const entry = this.entries.get(openId);
+    if (!entry) return undefined;
+    this.entries.delete(openId);
+    if (entry.expiresAt <= performance.now()) {
+      return undefined;
+    }
+    // Re-insert the same entry so Map order tracks recency (least recently
+    // used first); the bump must not extend expiresAt.
+    this.entries.set(openId, entry);
+    return entry.user;
+  }
+
+  // Call only with a row freshly read from the database.
+  set(user: User) {
+    this.entries.delete(user.openId);
+    this.entries.set(user.openId, {
+      user,
+      expiresAt: performance.now() + this.ttlMs,
+    });
+    if (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) this.entries.delete(oldest);
+    }
+  }
+
+  // Replace the cached copy after a local write, keeping the original expiry.
+  update(user: User) {
+    const entry = this.entries.get(user.openId);
+    if (entry) entry.user = user;
+  }
+
+  delete(openId: string) {
+    this.entries.delete(openId);
+  }
+}
@@ -1,5 +1,6 @@
-import { eq, desc } from "drizzle-orm";
+import { and, eq, desc, lt, sql } from "drizzle-orm";
 import { drizzle } from "drizzle-orm/mysql2";
+import { createPool } from "mysql2/promise";
 import { 
   InsertUser, 
   users, 
@@ -22,9 +23,14 @@ let _db: ReturnType<typeof drizzle> | null = null;
 
 // Lazily create the drizzle instance so local tooling can run without a DB.
 export async function getDb() {
-  if (!_db && process.env.DATABASE_URL) {
+  if (!_db && ENV.databaseUrl) {
     try {
-      _db = drizzle(process.env.DATABASE_URL);
+      // Size the pool explicitly so concurrent requests don't queue on connections.
+      const pool = createPool({
+        uri: ENV.databaseUrl,
+        connectionLimit: ENV.databasePoolSize,
+      });
+      _db = drizzle({ client: pool });
     } catch (error) {
       console.warn("[Database] Failed to connect:", error);
       _db = null;
@@ -80,7 +86,7 @@ export async function upsertUser(user: InsertUser): Promise<void> {
     }
 
     if (Object.keys(updateSet).length === 0) {
-      updateSet.lastSignedIn = new Date();
+      updateSet.lastSignedIn = values.lastSignedIn;
     }
 
     await db.insert(users).values(values).onDuplicateKeyUpdate({
@@ -92,6 +98,12 @@ export async function upsertUser(user: InsertUser): Promise<void> {
   }
 }
 
+// Looked up on every authenticated request, so build the statement only once.
+const prepareUserByOpenId = (db: NonNullable<typeof _db>) =>
+  db.select().from(users).where(eq(users.openId, sql.placeholder("openId"))).limit(1).prepare();
+
+let _userByOpenId: ReturnType<typeof prepareUserByOpenId> | null = null;
+
 export async function getUserByOpenId(openId: string) {
   const db = await getDb();
   if (!db) {
@@ -99,7 +111,8 @@ export async function getUserByOpenId(openId: string) {
     return undefined;
   }
 
-  const result = await db.select().from(users).where(eq(users.openId, openId)).limit(1);
+  _userByOpenId ??= prepareUserByOpenId(db);
+  const result = await _userByOpenId.execute({ openId });
 
   return result.length > 0 ? result[0] : undefined;
 }
@@ -121,6 +134,27 @@ export async function createBirthChart(chart: InsertBirthChart): Promise<BirthCh
   return inserted[0]!;
 }
 
+// Write the chart and its mazal analysis in a single transaction (one commit).
+export async function createBirthChartWithMazalAnalysis(
+  chart: InsertBirthChart,
+  analysis: Omit<InsertMazalAnalysis, "birthChartId">
+): Promise<BirthChart> {
+  const db = await getDb();
+  if (!db) {
+    throw new Error("Database not available");
+  }
+
+  return db.transaction(async (tx) => {
+    const result = await tx.insert(birthCharts).values(chart);
+    const insertedId = Number(result[0].insertId);
+
+    await tx.insert(mazalAnalyses).values({ ...analysis, birthChartId: insertedId });
+
+    const inserted = await tx.select().from(birthCharts).where(eq(birthCharts.id, insertedId)).limit(1);
+    return inserted[0]!;
+  });
+}
+
 export async function getBirthChartById(id: number): Promise<BirthChart | undefined> {
   const db = await getDb();
   if (!db) {
@@ -131,13 +165,24 @@ export async function getBirthChartById(id: number): Promise<BirthChart | undefi
   return result[0];
 }
 
-export async function getBirthChartsByUserId(userId: number): Promise<BirthChart[]> {
+// Keyset pagination over the auto-increment id: `cursor` is the id of the last
+// chart already returned, newest first.
+export async function getBirthChartsByUserId(
+  userId: number,
+  options: { limit?: number; cursor?: number } = {}
+): Promise<BirthChart[]> {
   const db = await getDb();
   if (!db) {
     return [];
   }
 
-  return db.select().from(birthCharts).where(eq(birthCharts.userId, userId)).orderBy(desc(birthCharts.createdAt));
+  const condition =
+    options.cursor !== undefined
+      ? and(eq(birthCharts.userId, userId), lt(birthCharts.id, options.cursor))
+      : eq(birthCharts.userId, userId);
+
+  const query = db.select().from(birthCharts).where(condition).orderBy(desc(birthCharts.id)).$dynamic();
+  return options.limit !== undefined ? query.limit(options.limit) : query;
 }
 
 export async function updateBirthChart(id: number, updates: Partial<InsertBirthChart>): Promise<void> {
@@ -208,7 +253,7 @@ export async function getReportsByUserId(userId: number): Promise<Report[]> {
     return [];
   }
 
-  return db.select().from(reports).where(eq(reports.userId, userId)).orderBy(desc(reports.generatedAt));
+  return db.select().from(reports).where(eq(reports.userId, userId)).orderBy(desc(reports.id));
 }
 
 export async function incrementReportDownloadCount(id: number): Promise<void> {
@@ -217,10 +262,8 @@ export async function incrementReportDownloadCount(id: number): Promise<void> {
     throw new Error("Database not available");
   }
 
-  const report = await db.select().from(reports).where(eq(reports.id, id)).limit(1);
-  if (report[0]) {
-    await db.update(reports).set({ downloadCount: (report[0].downloadCount || 0) + 1 }).where(eq(reports.id, id));
-  }
+  // Atomic in-place increment: no prior read, no lost updates under concurrency.
+  await db.update(reports).set({ downloadCount: sql`${reports.downloadCount} + 1` }).where(eq(reports.id, id));
 }
 
 // ============================================================================
@@ -246,5 +289,5 @@ export async function getCompatibilityAnalysesByUserId(userId: number): Promise<
     return [];
   }
 
-  return db.select().from(compatibilityAnalyses).where(eq(compatibilityAnalyses.userId, userId)).orderBy(desc(compatibilityAnalyses.createdAt));
+  return db.select().from(compatibilityAnalyses).where(eq(compatibilityAnalyses.userId, userId)).orderBy(desc(compatibilityAnalyses.id));
 }
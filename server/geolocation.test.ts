@@ -0,0 +1,51 @@
+import { describe, expect, it } from "vitest";
+import {
+  calculateDistance,
+  distanceFromJerusalem,
+  isValidTimezone,
+  JERUSALEM_COORDS,
+} from "../shared/geolocation";
+
+describe("Geolocation", () => {
+  it("should calculate haversine distance between two cities", () => {
+    // Nueva York -> Londres, ~5570 km
+    const distance = calculateDistance(40.7128, -74.006, 51.5074, -0.1278);
+
+    expect(distance).toBeCloseTo(5570.22, 1);
+  });
+
+  it("should return zero distance for the same point", () => {
+    const distance = calculateDistance(
+      JERUSALEM_COORDS.latitude,
+      JERUSALEM_COORDS.longitude,
+      JERUSALEM_COORDS.latitude,
+      JERUSALEM_COORDS.longitude
+    );
+
+    expect(distance).toBe(0);
+  });
+
+  it("should be symmetric", () => {
+    const a = calculateDistance(19.4326, -99.1332, 31.7683, 35.2137);
+    const b = calculateDistance(31.7683, 35.2137, 19.4326, -99.1332);
+
+    expect(a).toBeCloseTo(b, 6);
+  });
+
+  it("should calculate distance from a location to Jerusalem", () => {
+    // Ciudad de México -> Jerusalem, ~12527 km
+    const distance = distanceFromJerusalem({
+      latitude: 19.4326,
+      longitude: -99.1332,
+      timezone: "America/Mexico_City",
+    });
+
+    expect(distance).toBeCloseTo(12527.24, 1);
+  });
+
+  it("should validate IANA timezones", () => {
+    expect(isValidTimezone("Asia/Jerusalem")).toBe(true);
+    expect(isValidTimezone("America/Mexico_City")).toBe(true);
+    expect(isValidTimezone("Not/AZone")).toBe(false);
+  });
+});
@@ -71,6 +71,18 @@ describe("Mazal Analysis", () => {
     expect(comp1.score).toBe(comp2.score);
   });
 
+  it("should return symmetric compatibility scores for every pair of days", () => {
+    for (let day1 = 0; day1 < 7; day1++) {
+      for (let day2 = 0; day2 < 7; day2++) {
+        expect(calculateCompatibility(day1, day2).score).toBe(
+          calculateCompatibility(day2, day1).score
+        );
+      }
+    }
+    expect(calculateCompatibility(3, 4).score).toBe(90);
+    expect(calculateCompatibility(1, 1).score).toBe(40);
+  });
+
   it("should have all 7 mazal profiles defined", () => {
     expect(Object.keys(MAZAL_PROFILES)).toHaveLength(7);
     
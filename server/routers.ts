@@ -4,10 +4,9 @@ import { systemRouter } from "./_core/systemRouter";
 import { protectedProcedure, publicProcedure, router } from "./_core/trpc";
 import { z } from "zod";
 import {
-  createBirthChart,
+  createBirthChartWithMazalAnalysis,
   getBirthChartById,
   getBirthChartsByUserId,
-  createMazalAnalysis,
   getMazalAnalysisByChartId,
   createReport,
   getReportsByUserId,
@@ -18,6 +17,30 @@ import { convertToHebrewDate, getIntercalationCycleInfo } from "../shared/hebrew
 import { generateMazalAnalysis, calculateCompatibility } from "../shared/mazalAnalysis";
 import { adjustToJerusalemTime } from "../shared/geolocation";
 
+type MazalAnalysisResult = ReturnType<typeof generateMazalAnalysis>;
+
+// Los campos JSON del análisis dependen solo del perfil (día de la semana),
+// así que se serializan una vez por perfil y se reutilizan.
+const serializedMazalFields = new Map<
+  number,
+  { characteristics: string; strengths: string; challenges: string; lifeGuidance: string }
+>();
+
+function getSerializedMazalFields(mazalAnalysis: MazalAnalysisResult) {
+  const key = mazalAnalysis.profile.dayOfWeek;
+  let fields = serializedMazalFields.get(key);
+  if (!fields) {
+    fields = {
+      characteristics: JSON.stringify(mazalAnalysis.profile.characteristics),
+      strengths: JSON.stringify(mazalAnalysis.profile.strengths),
+      challenges: JSON.stringify(mazalAnalysis.profile.challenges),
+      lifeGuidance: JSON.stringify(mazalAnalysis.lifeGuidance),
+    };
+    serializedMazalFields.set(key, fields);
+  }
+  return fields;
+}
+
 export const appRouter = router({
   system: systemRouter,
   auth: router({
@@ -63,8 +86,11 @@ export const appRouter = router({
         // Obtener información del ciclo
         const cycleInfo = getIntercalationCycleInfo(hebrewDate.hebrewYear);
 
-        // Crear carta natal en la base de datos
-        const chart = await createBirthChart({
+        // Generar análisis de mazal
+        const mazalAnalysis = generateMazalAnalysis(hebrewDate.dayOfWeek, hebrewDate.hebrewYear);
+
+        // Guardar carta natal y análisis de mazal en una sola transacción
+        const chart = await createBirthChartWithMazalAnalysis({
           userId: ctx.user.id,
           personName: input.personName || null,
           gregorianDate: input.gregorianDate,
@@ -97,21 +123,11 @@ export const appRouter = router({
           primaryTrait: null,
           talmudReference: null,
           creationElement: null,
-        });
-
-        // Generar análisis de mazal
-        const mazalAnalysis = generateMazalAnalysis(hebrewDate.dayOfWeek, hebrewDate.hebrewYear);
-
-        // Guardar análisis de mazal
-        await createMazalAnalysis({
-          birthChartId: chart.id,
-          characteristics: JSON.stringify(mazalAnalysis.profile.characteristics),
-          strengths: JSON.stringify(mazalAnalysis.profile.strengths),
-          challenges: JSON.stringify(mazalAnalysis.profile.challenges),
+        }, {
+          ...getSerializedMazalFields(mazalAnalysis),
           talmudQuote: mazalAnalysis.profile.talmudQuote,
           zoharInsight: mazalAnalysis.profile.zoharInsight,
           spiritualPath: mazalAnalysis.spiritualPath,
-          lifeGuidance: JSON.stringify(mazalAnalysis.lifeGuidance),
         });
 
         return {
@@ -123,12 +139,22 @@ export const appRouter = router({
       }),
 
     /**
-     * Obtener todas las cartas natales del usuario
+     * Obtener las cartas natales del usuario (más recientes primero).
+     * Paginación opcional: `cursor` es el id de la última carta recibida.
      */
-    list: protectedProcedure.query(async ({ ctx }) => {
-      const charts = await getBirthChartsByUserId(ctx.user.id);
-      return charts;
-    }),
+    list: protectedProcedure
+      .input(
+        z
+          .object({
+            limit: z.number().int().min(1).max(100).optional(),
+            cursor: z.number().int().optional(),
+          })
+          .optional()
+      )
+      .query(async ({ ctx, input }) => {
+        const charts = await getBirthChartsByUserId(ctx.user.id, input ?? {});
+        return charts;
+      }),
 
     /**
      * Obtener una carta natal específica con su análisis
@@ -136,13 +162,14 @@ export const appRouter = router({
     getById: protectedProcedure
       .input(z.object({ id: z.number() }))
       .query(async ({ input }) => {
-        const chart = await getBirthChartById(input.id);
+        const [chart, mazalAnalysis] = await Promise.all([
+          getBirthChartById(input.id),
+          getMazalAnalysisByChartId(input.id),
+        ]);
         if (!chart) {
           throw new Error("Carta natal no encontrada");
         }
 
-        const mazalAnalysis = await getMazalAnalysisByChartId(input.id);
-
         return {
           chart,
           mazalAnalysis: mazalAnalysis
@@ -170,8 +197,10 @@ export const appRouter = router({
         })
       )
       .mutation(async ({ ctx, input }) => {
-        const chart1 = await getBirthChartById(input.chart1Id);
-        const chart2 = await getBirthChartById(input.chart2Id);
+        const [chart1, chart2] = await Promise.all([
+          getBirthChartById(input.chart1Id),
+          getBirthChartById(input.chart2Id),
+        ]);
 
         if (!chart1 || !chart2) {
           throw new Error("Una o ambas cartas natales no fueron encontradas");
@@ -0,0 +1,102 @@
+import { afterEach, describe, expect, it, vi } from "vitest";
+import type { User } from "../drizzle/schema";
+import { UserCache } from "./_core/userCache";
+
+function createUser(openId: string, overrides: Partial<User> = {}): User {
+  return {
+    id: 1,
+    openId,
+    email: `${openId}@example.com`,
+    name: "Sample User",
+    loginMethod: "manus",
+    role: "user",
+    createdAt: new Date(),
+    updatedAt: new Date(),
+    lastSignedIn: new Date(),
+    ...overrides,
+  };
+}
+
+describe("UserCache", () => {
+  let now = 0;
+
+  function mockClock() {
+    now = 0;
+    vi.spyOn(performance, "now").mockImplementation(() => now);
+  }
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it("should expire an entry 60s after the database read even when hit repeatedly", () => {
+    mockClock();
+    const cache = new UserCache(60_000, 100);
+    cache.set(createUser("admin", { role: "admin" }));
+
+    for (now = 0; now < 60_000; now += 10_000) {
+      expect(cache.get("admin")?.role).toBe("admin");
+    }
+
+    now = 60_000;
+    expect(cache.get("admin")).toBeUndefined();
+  });
+
+  it("should keep the original expiry when the cached copy is updated", () => {
+    mockClock();
+    const cache = new UserCache(60_000, 100);
+    cache.set(createUser("sample-user"));
+
+    now = 50_000;
+    const signedInAt = new Date();
+    cache.update(createUser("sample-user", { lastSignedIn: signedInAt }));
+    expect(cache.get("sample-user")?.lastSignedIn).toBe(signedInAt);
+
+    now = 60_000;
+    expect(cache.get("sample-user")).toBeUndefined();
+  });
+
+  it("should evict the least recently used entry once past the size limit", () => {
+    mockClock();
+    const cache = new UserCache(60_000, 3);
+    cache.set(createUser("a"));
+    cache.set(createUser("b"));
+    cache.set(createUser("c"));
+
+    // Hitting "a" makes "b" the least recently used entry.
+    expect(cache.get("a")).toBeDefined();
+    cache.set(createUser("d"));
+
+    expect(cache.size).toBe(3);
+    expect(cache.get("b")).toBeUndefined();
+    expect(cache.get("a")).toBeDefined();
+    expect(cache.get("c")).toBeDefined();
+    expect(cache.get("d")).toBeDefined();
+  });
+
+  it("should not extend expiry when a hit bumps recency", () => {
+    mockClock();
+    const cache = new UserCache(60_000, 2);
+    cache.set(createUser("a"));
+
+    now = 30_000;
+    cache.set(createUser("b"));
+    expect(cache.get("a")).toBeDefined();
+
+    now = 60_000;
+    expect(cache.get("a")).toBeUndefined();
+    expect(cache.get("b")).toBeDefined();
+
+    now = 90_000;
+    expect(cache.get("b")).toBeUndefined();
+  });
+
+  it("should drop an invalidated entry", () => {
+    mockClock();
+    const cache = new UserCache(60_000, 100);
+    cache.set(createUser("sample-user"));
+    cache.delete("sample-user");
+
+    expect(cache.get("sample-user")).toBeUndefined();
+  });
+});
@@ -3,7 +3,7 @@
  * Calcula diferencias horarias y ajusta fechas según cosmogonología cabalística
  */
 
-import { DateTime } from 'luxon';
+import { DateTime, IANAZone } from 'luxon';
 
 /**
  * Coordenadas de Jerusalem (referencia temporal cabalística)
@@ -41,6 +41,36 @@ export interface JerusalemTimeAdjustment {
   explanation: string;
 }
 
+/**
+ * Mapeo aproximado de offset UTC (horas) a zonas horarias comunes
+ */
+const OFFSET_TIMEZONES: Record<string, string> = {
+  '-11': 'Pacific/Midway',
+  '-10': 'Pacific/Honolulu',
+  '-9': 'America/Anchorage',
+  '-8': 'America/Los_Angeles',
+  '-7': 'America/Denver',
+  '-6': 'America/Mexico_City',
+  '-5': 'America/New_York',
+  '-4': 'America/Caracas',
+  '-3': 'America/Argentina/Buenos_Aires',
+  '-2': 'Atlantic/South_Georgia',
+  '-1': 'Atlantic/Azores',
+  '0': 'Europe/London',
+  '1': 'Europe/Paris',
+  '2': 'Europe/Athens',
+  '3': 'Asia/Jerusalem',
+  '4': 'Asia/Dubai',
+  '5': 'Asia/Karachi',
+  '6': 'Asia/Dhaka',
+  '7': 'Asia/Bangkok',
+  '8': 'Asia/Shanghai',
+  '9': 'Asia/Tokyo',
+  '10': 'Australia/Sydney',
+  '11': 'Pacific/Noumea',
+  '12': 'Pacific/Auckland',
+};
+
 /**
  * Obtiene la zona horaria IANA basada en coordenadas
  * Esta es una aproximación simple. En producción se usaría una API como Google Maps
@@ -56,36 +86,7 @@ export function getTimezoneFromCoordinates(
   // En producción, usar una API de timezone lookup
   const timezoneOffset = Math.round(longitude / 15);
   
-  // Mapeo aproximado de zonas horarias comunes
-  const timezoneMap: Record<number, string> = {
-    '-11': 'Pacific/Midway',
-    '-10': 'Pacific/Honolulu',
-    '-9': 'America/Anchorage',
-    '-8': 'America/Los_Angeles',
-    '-7': 'America/Denver',
-    '-6': 'America/Mexico_City',
-    '-5': 'America/New_York',
-    '-4': 'America/Caracas',
-    '-3': 'America/Argentina/Buenos_Aires',
-    '-2': 'Atlantic/South_Georgia',
-    '-1': 'Atlantic/Azores',
-    '0': 'Europe/London',
-    '1': 'Europe/Paris',
-    '2': 'Europe/Athens',
-    '3': 'Asia/Jerusalem',
-    '4': 'Asia/Dubai',
-    '5': 'Asia/Karachi',
-    '6': 'Asia/Dhaka',
-    '7': 'Asia/Bangkok',
-    '8': 'Asia/Shanghai',
-    '9': 'Asia/Tokyo',
-    '10': 'Australia/Sydney',
-    '11': 'Pacific/Noumea',
-    '12': 'Pacific/Auckland',
-  };
-  
-  const key = timezoneOffset.toString();
-  return (timezoneMap as Record<string, string>)[key] || 'UTC';
+  return OFFSET_TIMEZONES[timezoneOffset.toString()] || 'UTC';
 }
 
 /**
@@ -155,19 +156,35 @@ export function calculateDistance(
   lon1: number,
   lat2: number,
   lon2: number
+): number {
+  return haversine(lat1, lon1, Math.cos(toRad(lat1)), lat2, lon2, Math.cos(toRad(lat2)));
+}
+
+/**
+ * Núcleo de Haversine con los cosenos de latitud ya calculados,
+ * para poder reutilizarlos cuando uno de los puntos es fijo
+ */
+function haversine(
+  lat1: number,
+  lon1: number,
+  cosLat1: number,
+  lat2: number,
+  lon2: number,
+  cosLat2: number
 ): number {
   const R = 6371; // Radio de la Tierra en km
   const dLat = toRad(lat2 - lat1);
   const dLon = toRad(lon2 - lon1);
   
+  const sinHalfDLat = Math.sin(dLat / 2);
+  const sinHalfDLon = Math.sin(dLon / 2);
+  
   const a =
-    Math.sin(dLat / 2) * Math.sin(dLat / 2) +
-    Math.cos(toRad(lat1)) *
-      Math.cos(toRad(lat2)) *
-      Math.sin(dLon / 2) *
-      Math.sin(dLon / 2);
+    sinHalfDLat * sinHalfDLat +
+    cosLat1 * cosLat2 * sinHalfDLon * sinHalfDLon;
   
-  const c = 2 * Math.atan2(Math.sqrt(a), Math.sqrt(1 - a));
+  // asin(√a) equivale a atan2(√a, √(1−a)) con una sola raíz; min() protege del redondeo en antípodas
+  const c = 2 * Math.asin(Math.min(1, Math.sqrt(a)));
   const distance = R * c;
   
   return distance;
@@ -180,17 +197,24 @@ function toRad(degrees: number): number {
   return (degrees * Math.PI) / 180;
 }
 
+/**
+ * Coseno de la latitud de Jerusalem (constante, se calcula una sola vez)
+ */
+const COS_JERUSALEM_LATITUDE = Math.cos(toRad(JERUSALEM_COORDS.latitude));
+
 /**
  * Calcula la distancia desde una ubicación a Jerusalem
  * @param location Información de ubicación
  * @returns Distancia en kilómetros
  */
 export function distanceFromJerusalem(location: LocationInfo): number {
-  return calculateDistance(
+  return haversine(
     location.latitude,
     location.longitude,
+    Math.cos(toRad(location.latitude)),
     JERUSALEM_COORDS.latitude,
-    JERUSALEM_COORDS.longitude
+    JERUSALEM_COORDS.longitude,
+    COS_JERUSALEM_LATITUDE
   );
 }
 
@@ -277,10 +301,7 @@ export function getTimezoneOffset(timezone: string): number {
  * @returns true si es válida
  */
 export function isValidTimezone(timezone: string): boolean {
-  try {
-    DateTime.now().setZone(timezone);
-    return true;
-  } catch {
-    return false;
-  }
+  // setZone() no lanza con zonas inválidas (devuelve un DateTime inválido),
+  // así que se valida la zona directamente sin construir un DateTime
+  return IANAZone.isValidZone(timezone);
 }
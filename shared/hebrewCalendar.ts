@@ -13,6 +13,7 @@ import { DateTime } from 'luxon';
  * 12 años tienen 12 meses (resto)
  */
 const LEAP_YEARS_IN_CYCLE = [3, 6, 8, 11, 14, 17, 19];
+const LEAP_YEAR_SET = new Set(LEAP_YEARS_IN_CYCLE);
 
 /**
  * Mapeo de días de la semana a planetas según sistema hebreo
@@ -78,14 +79,15 @@ export function convertToHebrewDate(
   // Convertir a hora de Jerusalem
   const localDateTime = DateTime.fromJSDate(gregorianDate, { zone: timezone });
   const jerusalemDateTime = localDateTime.setZone('Asia/Jerusalem');
+  const jerusalemDate = jerusalemDateTime.toJSDate();
   
   // Crear objeto HDate de hebcal con hora de Jerusalem
-  const hdate = new Hebcal.HDate(jerusalemDateTime.toJSDate());
+  const hdate = new Hebcal.HDate(jerusalemDate);
   
   // Obtener información del año hebreo
   const hebrewYear = hdate.getFullYear();
   const yearInCycle = (hebrewYear % 19) || 19;
-  const isLeapYear = LEAP_YEARS_IN_CYCLE.includes(yearInCycle);
+  const isLeapYear = LEAP_YEAR_SET.has(yearInCycle);
   
   // Obtener mes hebreo
   const hebrewMonthNum = hdate.getMonth();
@@ -96,7 +98,7 @@ export function convertToHebrewDate(
   
   // Calcular puesta de sol para determinar inicio del día hebreo
   // La librería hebcal no expone Location, usamos aproximación de 7pm
-  const sunset = new Date(jerusalemDateTime.toJSDate());
+  const sunset = new Date(jerusalemDate);
   sunset.setHours(19, 0, 0, 0);
   
   // Los días hebreos comienzan al atardecer (aproximadamente 7pm/19:00)
@@ -131,7 +133,7 @@ export function convertToHebrewDate(
     sefira: planetInfo.sefira,
     isLeapYear,
     yearInCycle,
-    jerusalemTime: jerusalemDateTime.toJSDate(),
+    jerusalemTime: jerusalemDate,
     sunsetTime: sunset,
     adjustedHebrewDay,
   };
@@ -157,7 +159,7 @@ export function getTimezoneOffsetFromJerusalem(timezone: string): number {
  */
 export function isHebrewLeapYear(hebrewYear: number): boolean {
   const yearInCycle = (hebrewYear % 19) || 19;
-  return LEAP_YEARS_IN_CYCLE.includes(yearInCycle);
+  return LEAP_YEAR_SET.has(yearInCycle);
 }
 
 /**
@@ -167,7 +169,7 @@ export function isHebrewLeapYear(hebrewYear: number): boolean {
  */
 export function getIntercalationCycleInfo(hebrewYear: number) {
   const yearInCycle = (hebrewYear % 19) || 19;
-  const isLeapYear = LEAP_YEARS_IN_CYCLE.includes(yearInCycle);
+  const isLeapYear = LEAP_YEAR_SET.has(yearInCycle);
   const cycleNumber = Math.floor((hebrewYear - 1) / 19) + 1;
   
   return {
@@ -286,21 +286,24 @@ export function generateMazalAnalysis(dayOfWeek: number, hebrewYear: number) {
   };
 }
 
+/**
+ * Caminos espirituales por día de la semana (constante, se construye una sola vez)
+ */
+const SPIRITUAL_PATHS: Record<number, string> = {
+  0: 'Tu camino espiritual requiere elegir conscientemente entre luz y oscuridad. Cultiva la auto-observación y la meditación para reconocer tus tendencias extremas. Busca el balance a través del estudio de Torá y la práctica de mitzvot.',
+  1: 'Tu desafío espiritual es transformar el fuego de Guevurah en fuerza constructiva. Practica la paciencia y la respiración consciente. Estudia las enseñanzas sobre el control del temperamento y canaliza tu energía en causas justas.',
+  2: 'Tu abundancia es un regalo divino que debe ser canalizado con sabiduría. Practica la tzedaká (caridad) y establece límites claros. Cultiva la belleza interior a través del estudio y la contemplación de la armonía divina.',
+  3: 'Tu sabiduría debe ser compartida con humildad. Dedica tiempo al estudio profundo de textos sagrados y a la enseñanza. Recuerda que la verdadera sabiduría incluye el reconocimiento de lo que no sabes.',
+  4: 'Tu bondad natural es tu mayor fortaleza. Asegúrate de incluirte en tu círculo de compasión. Practica el servicio consciente y establece límites saludables. Tu comunicación puede sanar y elevar a otros.',
+  5: 'Tu búsqueda espiritual es profunda y genuina. Dedica tiempo a la meditación y la contemplación. Estudia Cabalá y misticismo judío. Recuerda mantener los pies en la tierra mientras exploras los cielos.',
+  6: 'Tu conexión con lo sagrado es natural. Honra el Shabat y las tradiciones ancestrales. Comparte tu sabiduría con las nuevas generaciones. Permite que la alegría y la flexibilidad complementen tu disciplina.',
+};
+
 /**
  * Genera guía espiritual basada en el perfil de mazal
  */
 function generateSpiritualPath(profile: MazalProfile): string {
-  const paths: Record<number, string> = {
-    0: 'Tu camino espiritual requiere elegir conscientemente entre luz y oscuridad. Cultiva la auto-observación y la meditación para reconocer tus tendencias extremas. Busca el balance a través del estudio de Torá y la práctica de mitzvot.',
-    1: 'Tu desafío espiritual es transformar el fuego de Guevurah en fuerza constructiva. Practica la paciencia y la respiración consciente. Estudia las enseñanzas sobre el control del temperamento y canaliza tu energía en causas justas.',
-    2: 'Tu abundancia es un regalo divino que debe ser canalizado con sabiduría. Practica la tzedaká (caridad) y establece límites claros. Cultiva la belleza interior a través del estudio y la contemplación de la armonía divina.',
-    3: 'Tu sabiduría debe ser compartida con humildad. Dedica tiempo al estudio profundo de textos sagrados y a la enseñanza. Recuerda que la verdadera sabiduría incluye el reconocimiento de lo que no sabes.',
-    4: 'Tu bondad natural es tu mayor fortaleza. Asegúrate de incluirte en tu círculo de compasión. Practica el servicio consciente y establece límites saludables. Tu comunicación puede sanar y elevar a otros.',
-    5: 'Tu búsqueda espiritual es profunda y genuina. Dedica tiempo a la meditación y la contemplación. Estudia Cabalá y misticismo judío. Recuerda mantener los pies en la tierra mientras exploras los cielos.',
-    6: 'Tu conexión con lo sagrado es natural. Honra el Shabat y las tradiciones ancestrales. Comparte tu sabiduría con las nuevas generaciones. Permite que la alegría y la flexibilidad complementen tu disciplina.',
-  };
-  
-  return paths[profile.dayOfWeek] || paths[0];
+  return SPIRITUAL_PATHS[profile.dayOfWeek] || SPIRITUAL_PATHS[0];
 }
 
 /**
@@ -316,6 +319,17 @@ function generateLifeGuidance(profile: MazalProfile): string[] {
   ];
 }
 
+// Puntuaciones de compatibilidad basadas en sefirot y planetas (simétrica, índice = día 0-6)
+const COMPATIBILITY_MATRIX: readonly (readonly number[])[] = [
+  [50, 60, 70, 80, 75, 65, 55],
+  [60, 40, 65, 70, 60, 55, 50],
+  [70, 65, 60, 85, 80, 70, 60],
+  [80, 70, 85, 75, 90, 85, 70],
+  [75, 60, 80, 90, 80, 75, 65],
+  [65, 55, 70, 85, 75, 70, 80],
+  [55, 50, 60, 70, 65, 80, 85],
+];
+
 /**
  * Calcula compatibilidad entre dos días de nacimiento
  * @param day1 Primer día de la semana
@@ -326,19 +340,7 @@ export function calculateCompatibility(day1: number, day2: number) {
   const profile1 = getMazalProfile(day1);
   const profile2 = getMazalProfile(day2);
   
-  // Lógica de compatibilidad basada en sefirot y planetas
-  const compatibilityMatrix: Record<string, number> = {
-    '0-0': 50, '0-1': 60, '0-2': 70, '0-3': 80, '0-4': 75, '0-5': 65, '0-6': 55,
-    '1-1': 40, '1-2': 65, '1-3': 70, '1-4': 60, '1-5': 55, '1-6': 50,
-    '2-2': 60, '2-3': 85, '2-4': 80, '2-5': 70, '2-6': 60,
-    '3-3': 75, '3-4': 90, '3-5': 85, '3-6': 70,
-    '4-4': 80, '4-5': 75, '4-6': 65,
-    '5-5': 70, '5-6': 80,
-    '6-6': 85,
-  };
-  
-  const key = day1 <= day2 ? `${day1}-${day2}` : `${day2}-${day1}`;
-  const score = compatibilityMatrix[key] || 50;
+  const score = COMPATIBILITY_MATRIX[day1]?.[day2] || 50;
   
   return {
     score,